@@ -1,17 +1,33 @@
 import json
 import os
+import secrets
 import string
 import tempfile
 
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
 from shutil import which, move
-from subprocess import CalledProcessError, run
-from typing import Any, Dict, List, Literal, Optional, NamedTuple, Tuple, Union
+from subprocess import DEVNULL, CalledProcessError, run
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, NamedTuple, Tuple, Union
 
 from .log import logger
 
 
 FFMPEG_CODEC_HEADER_LEN: int = 10
+# default arguments for every ffmpeg call
+FFMPEG_ARGS: Tuple[str, ...] = ("-hide_banner", "-loglevel", "panic")
+# default arguments for every ffprobe call, errors are only logged to stderr so they're kept
+FFPROBE_ARGS: Tuple[str, ...] = ("-hide_banner", "-loglevel", "error")
+PCM_DEPTHS: FrozenSet[int] = frozenset({8, 16, 24, 32, 64})
+# fixed-point seconds, ffmpeg can't parse exponents like str(1e-05)
+TIME_FORMAT: str = "{:.9f}"
+# output options for intermediate files: chapters don't survive trimming, timestamps start at zero
+TEMP_MUX_ARGS: Tuple[str, ...] = ("-map_chapters", "-1", "-avoid_negative_ts", "make_zero")
+# characters of clip arguments per ffmpeg process, Windows limits a whole command line to 32767
+MAX_CLIP_ARGS_LEN: int = 24000
 
 
 class StreamType(Enum):
@@ -42,48 +58,136 @@ class AudioStream(NamedTuple):
     stream_index: int
 
 
+@lru_cache(maxsize=8)
+def _find_executable(name: str, search_path: Optional[str] = None) -> Optional[str]:
+    """
+    Cached lookup of an executable, first in ``search_path`` and then in `PATH`.
+
+    :param name:        Executable to look for.
+    :param search_path: Path to search first.
+
+    :return:            Path to the executable, or ``None`` if it wasn't found.
+    """
+    return which(name, path=search_path) or (which(name) if search_path is not None else None)
+
+
+@lru_cache(maxsize=4)
+def _load_codecs(ffmpeg_path: str, mtime: float) -> Dict[str, Codec]:
+    """
+    Cached query of the codecs an ffmpeg binary supports.
+
+    :param ffmpeg_path: Path to ffmpeg.
+    :param mtime:       Modification time of ``ffmpeg_path``, so an updated binary is queried again.
+
+    :return:            Codecs by name.
+    """
+    logger.debug("ffmpeg command args: -codecs")
+    ffout = run([ffmpeg_path, *FFMPEG_ARGS, "-codecs"], capture_output=True, check=True, text=True).stdout.splitlines()
+    codecs: Dict[str, Codec] = {}
+    for codec in ffout[FFMPEG_CODEC_HEADER_LEN:]:
+        fields = codec.split(" ", 3)
+        features, name = fields[1], fields[2]
+        compression = CompressionType.NONE if features[4] == "." and features[5] == "." \
+            else CompressionType.EITHER if features[4] == "L" and features[5] == "S" \
+            else CompressionType.LOSSY if features[4] == "L" \
+            else CompressionType.LOSSLESS
+        codecs[name] = Codec(name=name,
+                             can_decode=features[0] == "D",
+                             can_encode=features[1] == "E",
+                             stream_type=StreamType(features[2]),
+                             compression_type=compression)
+    return codecs
+
+
+@lru_cache(maxsize=128)
+def _has_index_fmt(s: str) -> bool:
+    """
+    Cached check whether a format string has an ``{index}`` field.
+
+    :param s: Format string to check.
+
+    :return:  ``True`` if ``s`` contains ``{index}``.
+    """
+    return any(name == "index" for _, name, _, _ in string.Formatter().parse(s))
+
+
+def _safe_unlink(path: str) -> None:
+    """
+    Remove a file if it exists.
+
+    :param path: File to remove.
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _remove_result(job: "Future[str]") -> None:
+    """
+    Remove the file a job produced, if it finished successfully.
+
+    :param job: Job returning a file path.
+    """
+    if job.done() and not job.cancelled() and job.exception() is None:
+        _safe_unlink(job.result())
+
+
 def get_temp_filename(prefix: str = "", suffix: str = "") -> str:
-    return f"{prefix}{next(tempfile._get_candidate_names())}{suffix}"  # type: ignore
+    # created atomically so no two runs get the same name, ffmpeg overwrites it with -y.
+    # kept in the working directory so moving it to the output file is a rename, not a copy.
+    # unlike mkstemp's private files, the umask applies, since it may end up as the output file
+    while True:
+        path = f"{prefix}{secrets.token_hex(8)}{suffix}"
+        try:
+            os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+        except FileExistsError:
+            continue
+        return path
+
+
+def _temp_file(cleanup: ExitStack) -> str:
+    """
+    Create an intermediate file that is removed when ``cleanup`` closes.
+
+    :param cleanup: Stack to register the removal with.
+
+    :return:        Path to the file.
+    """
+    path = get_temp_filename(prefix="_acsuite_temp_", suffix=".mka")
+    cleanup.callback(_safe_unlink, path)
+    return path
 
 
 class FFmpeg():
     codecs: Dict[str, Codec]
 
     def __init__(self, search_path: Optional[str] = None) -> None:
-        self.ffargs = ["-hide_banner", "-loglevel", "panic"]
+        self.ffargs = list(FFMPEG_ARGS)
+        self.ffprobe_args = list(FFPROBE_ARGS)
         self.find_ffmpeg(search_path)
-        self.codecs = {}
         self.get_codecs()
 
     def get_codecs(self) -> None:
         """
         Query ffmpeg for supported codecs.
         """
-        ffout = self.ffmpeg("-codecs")
-        for codec in ffout[FFMPEG_CODEC_HEADER_LEN:]:
-            features = codec.split(" ")[1]
-            name = codec.split(" ")[2]
-            compression = CompressionType.NONE if features[4] == "." and features[5] == "." \
-                else CompressionType.EITHER if features[4] == "L" and features[5] == "S" \
-                else CompressionType.LOSSY if features[4] == "L" \
-                else CompressionType.LOSSLESS
-            self.codecs[name] = Codec(name=name,
-                                      can_decode=features[0] == "D",
-                                      can_encode=features[1] == "E",
-                                      stream_type=StreamType(features[2]),
-                                      compression_type=compression)
-
-    def ffmpeg(self, *args: str) -> List[str]:
+        # copy, so changes to one instance's codecs don't leak into the cache
+        self.codecs = dict(_load_codecs(self.ffmpeg_path, os.path.getmtime(self.ffmpeg_path)))
+
+    def ffmpeg(self, *args: str, input: Optional[str] = None) -> List[str]:
         """
         Run an ffmpeg command, text output.
 
-        :param args: ffmpeg arguments
+        :param args:  ffmpeg arguments
+        :param input: Text to feed to ffmpeg's stdin
 
-        :return:     stdout of ffmpeg
+        :return:      stdout of ffmpeg
         """
-        logger.debug("ffmpeg command args: {}".format(" ".join(list(args))))
-        return run([self.ffmpeg_path] + self.ffargs + list(args), capture_output=True, check=True, text=True) \
-            .stdout.splitlines()
+        logger.debug("ffmpeg command args: {}".format(" ".join(args)))
+        # keep ffmpeg off the terminal, concurrent processes would fight over keystrokes and tty modes
+        return run([self.ffmpeg_path, *self.ffargs, *args], input=input, stdin=None if input is not None else DEVNULL,
+                   capture_output=True, check=True, text=True).stdout.splitlines()
 
     def ffprobe_json(self, *args: str) -> Dict[str, Any]:
         """
@@ -92,8 +196,10 @@ class FFmpeg():
         :param args: ffprobe arguments
 
         :return:     json output
+
+        :raises CalledProcessError: If ffprobe fails, with its error messages in ``stderr``.
         """
-        ffout = run([self.ffprobe_path] + self.ffargs + ["-print_format", "json"] + list(args),
+        ffout = run([self.ffprobe_path, *self.ffprobe_args, "-print_format", "json", *args],
                     capture_output=True, check=True, text=True)
         return json.loads(ffout.stdout)
 
@@ -103,10 +209,11 @@ class FFmpeg():
 
         :param search_path: Path to search for binaries.
         """
-        ffmpeg = which("ffmpeg", path=search_path) or which("ffmpeg")
-        ffprobe = which("ffprobe", path=search_path) or which("ffprobe")
+        ffmpeg = _find_executable("ffmpeg", search_path)
+        ffprobe = _find_executable("ffprobe", search_path)
 
         if ffmpeg is None or ffprobe is None:
+            _find_executable.cache_clear()  # so a freshly installed ffmpeg gets found next time
             raise FileNotFoundError(f"eztrim: ffmpeg/ffprobe executables not found in {search_path or 'PATH'}")
 
         self.ffmpeg_path = ffmpeg
@@ -117,6 +224,7 @@ class FFmpegAudio(FFmpeg):
     ffprobe_path: str
     ffmpeg_path: str
     ffargs: List[str]
+    ffprobe_args: List[str]
 
     def get_audio_streams(self, filename: str, select: Union[int, List[int], None] = None) -> List[AudioStream]:
         """
@@ -129,16 +237,19 @@ class FFmpegAudio(FFmpeg):
         :return:         List of ``AudioStream``\\s
         """
         try:
-            json_streams = self.ffprobe_json("-show_streams", "-select_streams", "a", filename)["streams"]
-        except CalledProcessError:
-            raise ValueError(f"Could not probe \"{filename}\"! Does it exist and is it a media container?") from None
+            # only what's needed for an AudioStream
+            json_streams = self.ffprobe_json("-show_entries",
+                                             "stream=index,codec_name,bits_per_raw_sample,bits_per_sample",
+                                             "-select_streams", "a", filename)["streams"]
+        except CalledProcessError as e:
+            raise ValueError(f"Could not probe \"{filename}\"! Does it exist and is it a media container?\n"
+                             f"{e.stderr.strip()}") from None
         select = [select] if isinstance(select, int) else select
         streams: List[AudioStream] = []
         for s in json_streams:
-            depth = s.get("bits_per_raw_sample", s.get("bits_per_sample", None))
-            depth = int(depth) if int(depth) != 0 else None
-            codec = self.codecs[s["codec_name"]] if s["codec_name"] in self.codecs else None
-            streams.append(AudioStream(codec=codec, stream_index=s["index"], depth=depth))
+            # a missing or zero depth means ffprobe doesn't know it
+            depth = int(s.get("bits_per_raw_sample") or s.get("bits_per_sample") or 0) or None
+            streams.append(AudioStream(codec=self.codecs.get(s["codec_name"]), stream_index=s["index"], depth=depth))
         return streams if select is None else [streams[i] for i in select]
 
     def copy_or_decode(self, streams: List[AudioStream]) -> List[str]:
@@ -158,7 +269,7 @@ class FFmpegAudio(FFmpeg):
             if s.codec.can_encode:
                 ac += ["copy"]
             else:
-                best = f"pcm_s{s.depth}le" if s.depth in (8, 16, 24, 32, 64) else "pcm_s16le"
+                best = f"pcm_s{s.depth}le" if s.depth in PCM_DEPTHS else "pcm_s16le"
                 # this warning will be annoying but whatever just silence it :^)
                 if s.codec.compression_type == CompressionType.LOSSY:
                     logger.warning(f"Lossy codec {s.codec.name} is unsupported for encoding! Will decode to {best}.")
@@ -172,6 +283,32 @@ class FFmpegAudio(FFmpeg):
         logger.debug("selected codecs: {}".format(" ".join(ac)))
         return ac
 
+    def split_outputs(self, streams: List[AudioStream], output: Union[str, List[str]],
+                      filename: str = "") -> List[str]:
+        """
+        Resolve the output filename for every stream when writing each stream to its own file.
+
+        :param streams:   List of audio streams to write.
+        :param output:    Output file. If multiple streams are supplied, must contain
+                          either the format specifier ``index`` or be a list.
+                          ``index`` is the position of the stream in ``streams``.
+                          May contain ``filename`` format specifier.
+                          If not present, ".mka" will be appended.
+        :param filename:  Filename for output formatting.
+
+        :return:          Output filenames, in the same order as ``streams``.
+        """
+        output = [output] if isinstance(output, str) else output
+        output = [o + ".mka" if not o.lower().endswith(".mka") else o for o in output]
+        if len(streams) > 1:
+            if len(output) > 1 and len(streams) != len(output):
+                raise ValueError("Improper number of output filenames supplied!")
+            if len(streams) != len(output) and not _has_index_fmt(output[0]):
+                raise ValueError("Output filename does not have an index format specifier!")
+            if len(output) == 1:
+                output = [output[0]] * len(streams)
+        return [o.format(filename=filename, index=i) for i, o in enumerate(output[:len(streams)])]
+
     def map_streams(self, streams: List[AudioStream], output: Union[str, List[str]],
                     filename: str = "", combine: bool = True) -> List[str]:
         """
@@ -193,21 +330,12 @@ class FFmpegAudio(FFmpeg):
         ffmap: List[str] = []
 
         if not combine:
-            if len(streams) > 1:
-                if len(output) > 1 and len(streams) != len(output):
-                    raise ValueError("Improper number of output filenames supplied!")
-                if len(streams) != len(output) and \
-                        not any([name == "index" for _, name, _, _ in string.Formatter().parse(output[0])]):
-                    raise ValueError("Output filename does not have an index format specifier!")
-                if len(output) == 1:
-                    output = [output[0]] * len(streams)
-            output = [o.format(filename=filename, index=i) for o, i in zip(output, streams)]
-            for o, s in zip(output, streams):
+            for o, s in zip(self.split_outputs(streams, output, filename), streams):
                 ffmap += ["-map", f"0:{s.stream_index}", o]
         else:
             if len(output) > 1:
                 raise ValueError("Received too many output filenames!")
-            if any([name == "index" for _, name, _, _ in string.Formatter().parse(output[0])]):
+            if _has_index_fmt(output[0]):
                 raise ValueError("Found an index format specifier in output filename, but 'combine' is True!")
             for s in streams:
                 ffmap += ["-map", f"0:{s.stream_index}"]
@@ -216,31 +344,140 @@ class FFmpegAudio(FFmpeg):
         logger.debug("ffmap: {}".format(" ".join(ffmap)))
         return ffmap
 
-    def clip_single(self, filename: str, start: float, end: float, streams: List[AudioStream]) -> str:
+    def clip_single(self, filename: str, start: float, end: float, streams: List[AudioStream],
+                    codec_args: Optional[List[str]] = None) -> str:
         """
         Clip a single audio segment from a file.
 
-        :param filename: File to clip
-        :param start:    Start time
-        :param end:      End time
-        :param streams:  Streams to clip
+        :param filename:   File to clip
+        :param start:      Start time
+        :param end:        End time
+        :param streams:    Streams to clip
+        :param codec_args: Codec arguments for ``streams``, as returned by ``copy_or_decode``.
+                           If ``None``, they will be resolved. (Default: None)
 
-        :return:         Tempfile path containing clipped audio.
+        :return:           Tempfile path containing clipped audio.
         """
         if start >= end or start < 0:
             raise ValueError("Invalid clip range")
-        out = get_temp_filename(prefix="_acsuite_temp_", suffix=".mka")
-        try:
-            self.ffmpeg("-i", filename,
-                        "-ss", str(start),
-                        "-to", str(end),
-                        *self.copy_or_decode(streams),
-                        *self.map_streams(streams, out), "-y")
-        except CalledProcessError:
-            os.remove(out) if os.path.isfile(out) else None
-            raise ValueError(f"Could not clip \"{filename}\"! Does it exist and is it a media container?") from None
+        codec_args = self.copy_or_decode(streams) if codec_args is None else codec_args
+        if "copy" in codec_args:
+            # stream copy can only start on a packet the demuxer seeks to, which may be seconds early
+            seek = ["-i", filename, "-ss", TIME_FORMAT.format(start), "-to", TIME_FORMAT.format(end)]
+        else:
+            # decoding trims exactly, so let the demuxer skip ahead instead of reading up to start
+            seek = ["-ss", TIME_FORMAT.format(start), "-i", filename, "-t", TIME_FORMAT.format(end - start)]
+        with ExitStack() as cleanup:
+            out = _temp_file(cleanup)
+            try:
+                self.ffmpeg(*seek, *codec_args, *TEMP_MUX_ARGS, *self.map_streams(streams, out), "-y")
+            except CalledProcessError:
+                raise ValueError(f"Could not clip \"{filename}\"! Does it exist and is it a media container?") from None
+            cleanup.pop_all()
         return out
 
+    def clip_multi(self, filename: str, ranges: List[Tuple[float, float]], streams: List[AudioStream]) -> List[str]:
+        """
+        Clip multiple audio segments from a file, reading it as few times as possible.
+
+        Every range is written to its own output. The input is read once for as many ranges
+        as fit on one command line, longer lists are spread over several processes.
+
+        :param filename: File to clip
+        :param ranges:   Ranges to clip.
+        :param streams:  Streams to clip
+
+        :return:         Tempfile paths containing clipped audio, in the same order as ``ranges``.
+        """
+        if any(start >= end or start < 0 for start, end in ranges):
+            raise ValueError("Invalid clip range")
+        codec_args = self.copy_or_decode(streams)
+        with ExitStack() as cleanup:
+            outs: List[str] = []
+            batches: List[List[str]] = [[]]
+            batch_len = 0
+            for start, end in ranges:
+                outs += [_temp_file(cleanup)]
+                clip = ["-ss", TIME_FORMAT.format(start),
+                        "-to", TIME_FORMAT.format(end),
+                        *codec_args,
+                        *TEMP_MUX_ARGS,
+                        *self.map_streams(streams, outs[-1])]
+                clip_len = sum(len(a) + 1 for a in clip)
+                if batches[-1] and batch_len + clip_len > MAX_CLIP_ARGS_LEN - len(filename):
+                    batches += [[]]
+                    batch_len = 0
+                batches[-1] += clip
+                batch_len += clip_len
+            try:
+                for batch in batches:
+                    self.ffmpeg("-i", filename, *batch, "-y")
+            except CalledProcessError:
+                raise ValueError(f"Could not clip \"{filename}\"! Does it exist and is it a media container?") from None
+            # the clips are the caller's to remove from here on
+            cleanup.pop_all()
+        return outs
+
+    def clip_filter(self, filename: str, ranges: List[Tuple[float, float]], streams: List[AudioStream],
+                    outfile: Union[str, List[str], None] = None) -> List[str]:
+        """
+        Clip and concatenate multiple audio segments from a file in a single pass.
+
+        Every range is trimmed with an ``atrim`` filter and joined with the ``concat`` filter,
+        so the input is only demuxed and decoded once. Filters require decoded audio,
+        so this is only suitable for streams that are not stream-copied.
+
+        :param filename: File to clip
+        :param ranges:   Ranges to trim and append.
+        :param streams:  Streams to clip
+        :param outfile:  Output file. If a list, every stream is written to its own file.
+                         If ``None``, a tempfile will be used. (Default: None)
+
+        :return:         Paths containing clipped audio.
+        """
+        if any(start >= end or start < 0 for start, end in ranges):
+            raise ValueError("Invalid clip range")
+        graph: List[str] = []
+        pads = ""
+        for k, (start, end) in enumerate(ranges):
+            trim = f"atrim=start={TIME_FORMAT.format(start)}:end={TIME_FORMAT.format(end)},asetpts=PTS-STARTPTS"
+            for j, s in enumerate(streams):
+                graph += [f"[0:{s.stream_index}]{trim}[a{k}_{j}]"]
+                pads += f"[a{k}_{j}]"
+        graph += [f"{pads}concat=n={len(ranges)}:v=0:a={len(streams)}"
+                  + "".join(f"[o{j}]" for j in range(len(streams)))]
+        with ExitStack() as cleanup, ExitStack() as remove_temps:
+            # the graph grows with every range, so it's read from a file instead of passed as one huge argument
+            fd, script = tempfile.mkstemp(prefix="_acsuite_graph_", suffix=".txt")
+            cleanup.callback(_safe_unlink, script)
+            with os.fdopen(fd, "w") as f:
+                f.write(";\n".join(graph))
+            if isinstance(outfile, list):
+                # split straight from the filter graph, every output gets its own codec arguments
+                split_args = [self.copy_or_decode([s]) for s in streams]
+                temps = [_temp_file(remove_temps) for _ in streams]
+                ffout = [x for j, (codec_args, t) in enumerate(zip(split_args, temps))
+                         for x in ("-map", f"[o{j}]", *codec_args, t)]
+            else:
+                codec_args = self.copy_or_decode(streams)
+                temps = [_temp_file(remove_temps)]
+                ffout = [*[x for j in range(len(streams)) for x in ("-map", f"[o{j}]")],
+                         *codec_args,
+                         temps[0]]
+            try:
+                self.ffmpeg("-i", filename,
+                            "-filter_complex_script", script,
+                            *ffout, "-y")
+            except CalledProcessError:
+                raise ValueError(f"Could not clip \"{filename}\"! Does it exist and is it a media container?") from None
+            # existing output files are only replaced once everything was written
+            outs = outfile if isinstance(outfile, list) else [outfile or temps[0]]
+            for t, o in zip(temps, outs):
+                if t != o:
+                    move(t, o)
+            remove_temps.pop_all()
+        return outs
+
     def concat(self, *files: str) -> str:
         """
         Concatenate files.
@@ -249,25 +486,25 @@ class FFmpegAudio(FFmpeg):
 
         :return:      Tempfile path containing concatenated audio.
         """
-        cf = get_temp_filename(prefix="_acsuite_temp_", suffix=".txt")
-        out = get_temp_filename(prefix="_acsuite_temp_", suffix=".mka")
-        with open(cf, "w") as cfo:
-            for f in files:
-                f = f.replace("'", "'\\''")
-                cfo.write(f"file '{f}'\n")
-        try:
-            self.ffmpeg("-f", "concat",
-                        "-i", cf,
-                        "-c", "copy",
-                        out, "-y")
-        except CalledProcessError:
-            os.remove(cf)
-            os.remove(out) if os.path.isfile(out) else None
-            raise ValueError("Could not concatenate!") from None
-        os.remove(cf)
+        # entries of a piped list resolve against "pipe:", so they have to be absolute file: urls
+        manifest = "".join("file 'file:{}'\n".format(os.path.abspath(f).replace("'", "'\\''")) for f in files)
+        with ExitStack() as cleanup:
+            out = _temp_file(cleanup)
+            try:
+                self.ffmpeg("-f", "concat",
+                            "-safe", "0",
+                            "-protocol_whitelist", "pipe,file",
+                            "-i", "pipe:0",
+                            "-map", "0",
+                            "-c", "copy",
+                            *TEMP_MUX_ARGS,
+                            out, "-y", input=manifest)
+            except CalledProcessError:
+                raise ValueError("Could not concatenate!") from None
+            cleanup.pop_all()
         return out
 
-    def split(self, filename: str, outfile: Union[str, List[str]]) -> None:
+    def split(self, filename: str, outfile: Union[str, List[str]], streams: Optional[List[AudioStream]] = None) -> None:
         """
         Split audio streams from a multimedia container into multiple files.
 
@@ -276,14 +513,18 @@ class FFmpegAudio(FFmpeg):
                           specifiers. If there are multiple streams, either an ``index``
                           formatter or a sufficient number of filenames must be supplied.
                           If not present, ".mka" will be appended.
+        :param streams:   Audio streams in ``filename``, if already known. ``filename`` must contain
+                          only these streams, in this order. (Default: None, probe ``filename``)
         """
-        streams = self.get_audio_streams(filename)
-        self.ffmpeg("-i", filename,
-                    "-c", "copy",
-                    "-vn", "-sn",
-                    *self.map_streams(streams, outfile, filename, combine=False),
-                    "-y"
-                    )
+        if streams is None:
+            streams = self.get_audio_streams(filename)
+        else:
+            streams = [s._replace(stream_index=i) for i, s in enumerate(streams)]
+        ffout: List[str] = []
+        for o, s in zip(self.split_outputs(streams, outfile, filename), streams):
+            # codec options only apply to the next output file, so every output needs its own
+            ffout += ["-map", f"0:{s.stream_index}", "-c", "copy", o]
+        self.ffmpeg("-i", filename, *ffout, "-y")
 
     def join(self, outfile: str, *filenames: str) -> None:
         """
@@ -292,16 +533,16 @@ class FFmpegAudio(FFmpeg):
         :param outfile:   Output file.
         :param filenames: Files to join into container.
         """
-        self.ffmpeg(*[x for y in list(zip(["-i"]*len(filenames), filenames)) for x in y],
-                    *[x for y in list(zip(["-map"]*len(filenames), [f"{i:d}:a" for i in range(len(filenames))]))
-                      for x in y],
+        self.ffmpeg(*chain.from_iterable(("-i", f) for f in filenames),
+                    *chain.from_iterable(("-map", f"{i}:a") for i in range(len(filenames))),
                     "-c", "copy",
                     outfile,
                     "-y"
                     )
 
     def recut(self, filename: str, ranges: List[Tuple[float, float]], streams: List[AudioStream],
-              outfile: Union[str, List[str]] = "{filename}_ATrim.mka", combine: bool = True) -> List[str]:
+              outfile: Union[str, List[str]] = "{filename}_ATrim.mka", combine: bool = True,
+              parallel: bool = True, legacy_concat: bool = False) -> List[str]:
         """
         Recut audio from a multimedia container.
 
@@ -317,35 +558,76 @@ class FFmpegAudio(FFmpeg):
                           If not present, ".mka" will be appended.
                           (Default: "{filename}_ATrim.mka")
         :param combine:   Output all trimmed streams into a single file. (Default: True)
+        :param parallel:  Clip ranges concurrently, one ffmpeg process per CPU. (Default: True)
+        :param legacy_concat: Always clip every range to a tempfile and concatenate them afterwards,
+                              even if all streams could be trimmed in a single pass. (Default: False)
         """
         outfile = [outfile] if isinstance(outfile, str) else outfile
         outfile = [o + ".mka" if not o.lower().endswith(".mka") else o for o in outfile]
-        partials: List[str] = []
+        split = not combine and len(streams) > 1
 
-        try:
-            # generate clips
-            # can't use a list comprehension here otherwise we'll lose the
-            # entire list for cleanup
-            for r in ranges:
-                partials.append(self.clip_single(filename, r[0], r[1], streams))
+        if split:
+            outputs = self.split_outputs(streams, outfile, filename)
+        else:
+            if len(outfile) > 1:
+                raise ValueError("Received too many output filenames!")
+            if _has_index_fmt(outfile[0]):
+                raise ValueError("Found an index format specifier in output filename, but 'combine' is True!")
+            outputs = [outfile[0].format(filename=filename)]
+
+        # every tempfile is registered for removal as soon as it is created
+        with ExitStack() as cleanup:
+            copied = [s.codec is not None and s.codec.can_encode for s in streams]
+            if len(ranges) > 1 and not legacy_concat and not any(copied):
+                # every stream gets decoded anyway, so trim and concatenate in one pass
+                # and write straight to the output files
+                self.clip_filter(filename, ranges, streams, outputs if split else outputs[0])
+                return outputs
+
+            if len(ranges) > 1 and not legacy_concat and all(copied):
+                # packets are only copied, so a single read of the input can feed every clip
+                partials = self.clip_multi(filename, ranges, streams)
+                for p in partials:
+                    cleanup.callback(_safe_unlink, p)
+            else:
+                # generate clips
+                # every ffmpeg process is independent, so run them side by side
+                # with codecs resolved only once for all of them
+                codec_args = self.copy_or_decode(streams)
+                workers = min(len(ranges), os.cpu_count() or 1) if parallel else 1
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    jobs: List["Future[str]"] = []
+                    try:
+                        for start, end in ranges:
+                            jobs += [executor.submit(self.clip_single, filename, start, end, streams, codec_args)]
+                            # the executor finishes running clips before the stack unwinds, so they get removed too
+                            cleanup.callback(_remove_result, jobs[-1])
+                        # don't start any more clips once one has failed
+                        for job in as_completed(jobs):
+                            if job.exception() is not None:
+                                break
+                    finally:
+                        # the executor would run every queued clip before letting an error or interrupt through
+                        for j in jobs:
+                            j.cancel()
+                jobs = [j for j in jobs if not j.cancelled()]
+                errors = [e for e in (j.exception() for j in jobs) if e is not None]
+                if errors:
+                    raise errors[0]
+                partials = [j.result() for j in jobs]
 
             # concatenate, if necessary
-            clipped = self.concat(*partials) if len(ranges) > 1 else partials[0]
+            if len(ranges) > 1:
+                clipped = self.concat(*partials)
+                cleanup.callback(_safe_unlink, clipped)
+            else:
+                clipped = partials[0]
 
-            # split and rename
-            if not combine and len(streams) > 1:
-                self.split(clipped, outfile)
-                if len(outfile) != len(streams):
-                    outfile = [outfile[0]] * len(streams)
+            # split and rename, the clipped file holds exactly the selected streams
+            if split:
+                self.split(clipped, outputs, streams)
             else:
-                if len(outfile) > 1:
-                    raise ValueError("Received too many output filenames!")
-                if any([name == "index" for _, name, _, _ in string.Formatter().parse(outfile[0])]):
-                    raise ValueError("Found an index format specifier in output filename, but 'combine' is True!")
-                move(clipped, outfile[0].format(filename=filename))
-        finally:
-            for p in partials:
-                os.remove(p) if os.path.isfile(p) else None
-            os.remove(clipped) if os.path.isfile(clipped) else None
-
-        return [o.format(filename=filename, index=i) for o, i in zip(outfile, streams)]
+                # unlike os.replace, shutil.move falls back to copying across filesystems
+                move(clipped, outputs[0])
+
+        return outputs
@@ -1,13 +1,18 @@
+import os
+import time
+
+import numpy as np
 import vapoursynth as vs
 
 from fractions import Fraction
 from functools import lru_cache
+from math import gcd
 from typing import List, Optional, Union, Tuple, cast
 
 from .types import Trim
 
 
-def get_timecodes(timecodes_file: Optional[str] = None, clip: Optional[vs.VideoNode] = None) -> List[float]:
+def get_timecodes(timecodes_file: Optional[str] = None, clip: Optional[vs.VideoNode] = None) -> np.ndarray:
     """
     Get timecodes for every frame.
 
@@ -17,10 +22,10 @@ def get_timecodes(timecodes_file: Optional[str] = None, clip: Optional[vs.VideoN
     :param timecodes_file: Path to v2 timecodes plaintext file.
     :param clip:           Reference vapoursynth clip. If vfr, the timecodes will be calculated.
 
-    :return:               List of timecodes.
+    :return:               Array of timecodes.
     """
     if timecodes_file is not None:
-        return [float(x) / 1000 for x in open(timecodes_file, "r").read().splitlines()[1:]]
+        return _load_timecodes_file(timecodes_file, os.path.getmtime(timecodes_file))
 
     if clip is None:
         raise ValueError("get_timecodes: need a clip or timecodes file")
@@ -28,11 +33,54 @@ def get_timecodes(timecodes_file: Optional[str] = None, clip: Optional[vs.VideoN
     if clip.fps == Fraction(0, 1):
         return clip_to_timecodes(clip)
 
-    return [round(float(1e9*f*(1/clip.fps)))/1e9 for f in range(0, clip.num_frames + 1)]
+    return _cfr_timecodes(clip.num_frames, clip.fps.numerator, clip.fps.denominator)
+
+
+def _read_only(timecodes: np.ndarray) -> np.ndarray:
+    """
+    Make a cached array of timecodes read-only, as it's shared by every caller.
+
+    :param timecodes: Array to protect.
+
+    :return:          The same array.
+    """
+    timecodes.flags.writeable = False
+    return timecodes
+
+
+@lru_cache(maxsize=8)
+def _cfr_timecodes(num_frames: int, fps_num: int, fps_den: int) -> np.ndarray:
+    """
+    Cached function to calculate timecodes for cfr clips.
+
+    :param num_frames: Number of frames in the clip.
+    :param fps_num:    Framerate numerator.
+    :param fps_den:    Framerate denominator.
+
+    :return:           Read-only array of timecodes.
+    """
+    inv_fps = fps_den / fps_num
+    timecodes = np.round(1e9 * np.arange(num_frames + 1, dtype=np.float64) * inv_fps) / 1e9
+    return _read_only(timecodes)
+
+
+@lru_cache(maxsize=8)
+def _load_timecodes_file(timecodes_file: str, mtime: float) -> np.ndarray:
+    """
+    Cached function to load a v2 timecodes file.
+
+    :param timecodes_file: Path to v2 timecodes plaintext file.
+    :param mtime:          Modification time of the file, so edited files get reloaded.
+
+    :return:               Read-only array of timecodes.
+    """
+    # skip the "# timecode format v2" header, ndmin keeps single-frame files 1-d
+    timecodes = np.loadtxt(timecodes_file, skiprows=1, ndmin=1, dtype=np.float64) / 1000
+    return _read_only(timecodes)
 
 
 def frames_to_timecodes(ranges: Union[Trim, List[Trim]],
-                        timecodes: List[float]) -> List[Tuple[float, float]]:
+                        timecodes: Union[np.ndarray, List[float]]) -> List[Tuple[float, float]]:
     """
     Convert a list of frame ranges to a list of timestamp ranges.
 
@@ -44,29 +92,43 @@ def frames_to_timecodes(ranges: Union[Trim, List[Trim]],
     ranges = [ranges] if isinstance(ranges, tuple) else ranges
     num_frames = len(timecodes) - 1
 
-    out = []
-    for r in ranges:
-        start, end = r
-        start = 0 if start is None else start
-        start = start + num_frames if start < 0 else start
-        end = num_frames if end is None else end
-        end = end + num_frames if end <= 0 else end
-        if start >= end:
-            raise ValueError("frames_to_timecodes: start frame is later than end frame")
-        out.append((timecodes[start], timecodes[end]))
+    if not ranges:
+        return []
 
-    return out
+    try:
+        bounds = np.array(ranges)
+    except ValueError:
+        bounds = np.empty(0)
+    if bounds.ndim != 2 or bounds.shape[1] != 2:
+        raise ValueError("frames_to_timecodes: ranges must be 2-tuples")
+    if bounds.dtype == object:
+        # empty slices have to be filled in first, ranges without any ``None`` skip this
+        bounds = np.array([(0 if start is None else start, num_frames if end is None else end)
+                           for start, end in ranges])
+    if bounds.dtype.kind not in "iu":
+        raise TypeError("frames_to_timecodes: frame numbers must be integers or None")
+    if (np.abs(bounds) > num_frames).any():
+        raise ValueError("frames_to_timecodes: frame number is out of bounds")
+    starts = np.where(bounds[:, 0] < 0, bounds[:, 0] + num_frames, bounds[:, 0])
+    ends = np.where(bounds[:, 1] <= 0, bounds[:, 1] + num_frames, bounds[:, 1])
+    unordered = np.flatnonzero(starts >= ends)
+    if unordered.size:
+        raise ValueError(f"frames_to_timecodes: start frame is later than end frame in range {unordered[0]}")
+
+    # fetch every timestamp in a single lookup
+    times = np.asarray(timecodes)[np.concatenate((starts, ends))].tolist()
+    return list(zip(times[:len(starts)], times[len(starts):]))
 
 
 @lru_cache
-def clip_to_timecodes(src_clip: vs.VideoNode) -> List[float]:
+def clip_to_timecodes(src_clip: vs.VideoNode) -> np.ndarray:
     """
-    Cached function to return a list of timecodes for vfr clips.
+    Cached function to return an array of timecodes for vfr clips.
 
     The first call to this function can be `very` expensive depending on the `src_clip`
     length and the source filter used.
 
-    Subsequent calls on the same clip will return the previously generated list of timecodes.
+    Subsequent calls on the same clip will return the previously generated (read-only) array of timecodes.
     The timecodes are `floats` representing seconds from the start of the `src_clip`.
 
     If you have ``rich`` installed, will output a pretty progress bar as this process can take a long time.
@@ -81,16 +143,34 @@ def clip_to_timecodes(src_clip: vs.VideoNode) -> List[float]:
 
         rich = False
 
-    timecodes = [0.0]
-    curr_time = Fraction()
-    for frame in track(src_clip.frames(), description="Finding timestamps...", total=src_clip.num_frames):
-        num = cast(int, frame.props["_DurationNum"])
-        den = cast(int, frame.props["_DurationDen"])
-        curr_time += Fraction(num, den)
-        timecodes.append(float(curr_time))
+    # keep the source filter busy on upcoming frames while we read the props of the current one
+    threads = vs.core.num_threads
+    try:
+        frames = src_clip.frames(prefetch=threads, backlog=2 * threads, close=True)  # type: ignore
+    except TypeError:  # VapourSynth < R58 can prefetch, but not close frames
+        frames = src_clip.frames(prefetch=threads, backlog=2 * threads)  # type: ignore
+
+    nums = np.empty(src_clip.num_frames, dtype=np.int64)
+    dens = np.empty(src_clip.num_frames, dtype=np.int64)
+    percent = 100 / max(src_clip.num_frames, 1)
+    last_print = 0.0
+    for i, frame in enumerate(track(frames, description="Finding timestamps...", total=src_clip.num_frames)):
+        nums[i] = cast(int, frame.props["_DurationNum"])
+        dens[i] = cast(int, frame.props["_DurationDen"])
         if rich:
             pass  # if ran in a normal console/terminal, should render a pretty progress bar
-        else:
-            print(f"Generating timecodes: {round(100 * len(timecodes) / src_clip.num_frames)}%", end="\r")
-    print("")
-    return timecodes
+        elif time.monotonic() - last_print > 0.1:
+            # printing every frame can take longer than reading it, 10 updates a second are plenty
+            print(f"Generating timecodes: {round((i + 1) * percent)}%", end="\r")
+            last_print = time.monotonic()
+    print("" if rich else "Generating timecodes: 100%")
+    # sum up all frame durations at once, exactly over a common denominator if int64 can hold the total
+    common = 1
+    for den in np.unique(dens).tolist():
+        common = common * den // gcd(common, den)
+    if int(nums.max(initial=0)) * common * len(nums) < 2 ** 63:
+        ticks = np.concatenate(([0], np.cumsum(nums * (common // dens))))
+        timecodes = ticks / common
+    else:
+        timecodes = np.concatenate(([0.0], np.cumsum(nums / dens, dtype=np.float64)))
+    return _read_only(timecodes)
@@ -18,6 +18,8 @@ def eztrim(
     *,
     ffmpeg_path: Optional[str] = None,
     timecodes_file: Optional[str] = None,
+    parallel: bool = True,
+    legacy_concat: bool = False,
 ) -> List[str]:
     """
     Simple trimming function that follows VapourSynth/Python slicing syntax.
@@ -68,11 +70,16 @@ def eztrim(
     :param timecodes_file: Timecodes v2 file (generated by vspipe, ffms2, etc.) for variable-frame-rate clips.
                            Not needed for CFR clips.
 
+    :param parallel:    Run independent ffmpeg processes concurrently when clipping multiple trims.
+                        (Default: True)
+
+    :param legacy_concat: Always clip every trim to a temporary file and concatenate them afterwards,
+                          instead of trimming decoded audio in a single ffmpeg pass. (Default: False)
+
     :return: Returns output file names as strings.
     """
-    trims = [trims] if isinstance(trims, tuple) else trims
     timecodes = get_timecodes(timecodes_file, ref_clip or vs.core.ffms2.Source(src))
     ranges = frames_to_timecodes(trims, timecodes)
     ffmpeg = FFmpegAudio(ffmpeg_path)
     selected = ffmpeg.get_audio_streams(src, streams)
-    return ffmpeg.recut(src, ranges, selected, outfile, combine)
+    return ffmpeg.recut(src, ranges, selected, outfile, combine, parallel=parallel, legacy_concat=legacy_concat)
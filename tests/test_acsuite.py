@@ -1,7 +1,9 @@
 import os
 import shutil
+import tempfile
 import unittest
 from fractions import Fraction
+from subprocess import CalledProcessError
 
 import vapoursynth as vs
 
@@ -56,6 +58,46 @@ class ACsuiteTests(unittest.TestCase):
             ([0, 20, 30], [10, 100, 70]),
         )
 
+    def test_frames_to_timecodes(self):
+        timecodes = acsuite.get_timecodes(clip=self.BLANK_CLIP)
+
+        self.assertEqual(acsuite.frames_to_timecodes((None, None), timecodes), [(0.0, 20.0)])
+        self.assertEqual(acsuite.frames_to_timecodes((-90, -20), timecodes), [(2.0, 16.0)])
+        self.assertEqual(
+            acsuite.frames_to_timecodes([(3, 22), (48, 49), (97, None)], timecodes),
+            [(0.6, 4.4), (9.6, 9.8), (19.4, 20.0)],
+        )
+
+        with self.assertRaisesRegex(ValueError, "bounds"):
+            acsuite.frames_to_timecodes((None, 101), timecodes)
+        with self.assertRaisesRegex(TypeError, "integers"):
+            acsuite.frames_to_timecodes((1, "str"), timecodes)
+        with self.assertRaisesRegex(ValueError, "2-tuples"):
+            acsuite.frames_to_timecodes([(1, 2), (1, 2, 3)], timecodes)
+        with self.assertRaisesRegex(ValueError, "later"):
+            acsuite.frames_to_timecodes([(None, 2), (10, 8)], timecodes)
+
+    def test_get_timecodes_read_only(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            timecodes_file = os.path.join(tempdir, "timecodes.txt")
+            with open(timecodes_file, "w") as f:
+                f.write("# timecode format v2\n0\n200\n400\n")
+            cached = [acsuite.get_timecodes(clip=self.BLANK_CLIP),
+                      acsuite.get_timecodes(clip=self.VFR_CLIP),
+                      acsuite.get_timecodes(timecodes_file)]
+
+        for timecodes in cached:
+            with self.assertRaises(ValueError):
+                timecodes[0] = 1.0
+
+    def test_clip_to_timecodes_exact(self):
+        timecodes = acsuite.clip_to_timecodes(self.VFR_CLIP)
+
+        self.assertEqual(len(timecodes), self.VFR_CLIP.num_frames + 1)
+        self.assertEqual(timecodes[24000], 1001.0)
+        self.assertEqual(timecodes[24001], float(Fraction(1001) + Fraction(1001, 30000)))
+        self.assertEqual(timecodes[-1], 2002.0)
+
     def test_f2ts_and_clip_to_timecodes(self):
         with self.assertRaisesRegex(ValueError, "multiple of 3"):
             acsuite.f2ts(0, src_clip=self.BLANK_CLIP, precision=1)
@@ -227,5 +269,199 @@ class ACsuiteTests(unittest.TestCase):
         )
 
 
+class RecordingFFmpegAudio(acsuite.FFmpegAudio):
+    """FFmpegAudio that records ffmpeg arguments instead of running ffmpeg."""
+
+    def __init__(self):
+        self.ffargs = []
+        self.codecs = {}
+        self.calls = []
+        self.inputs = []
+        self.graphs = []
+        # calls with this argument raise ``error``
+        self.fail_on = None
+        self.error = CalledProcessError(1, "ffmpeg")
+
+    def ffmpeg(self, *args, input=None):
+        self.calls.append(list(args))
+        self.inputs.append(input)
+        if "-filter_complex_script" in args:
+            with open(args[args.index("-filter_complex_script") + 1]) as f:
+                self.graphs.append(f.read())
+        if self.fail_on in args:
+            raise self.error
+        return []
+
+
+class FFmpegAudioTests(unittest.TestCase):
+    FLAC = acsuite.Codec(stream_type=acsuite.StreamType.AUDIO, compression_type=acsuite.CompressionType.LOSSLESS,
+                         name="flac", can_decode=True, can_encode=True)
+    PCM = acsuite.Codec(stream_type=acsuite.StreamType.AUDIO, compression_type=acsuite.CompressionType.LOSSLESS,
+                        name="pcm_s24le", can_decode=True, can_encode=False)
+    STREAMS = [acsuite.AudioStream(codec=FLAC, depth=16, stream_index=1),
+               acsuite.AudioStream(codec=PCM, depth=24, stream_index=2)]
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tempdir = tempfile.TemporaryDirectory()
+        os.chdir(self.tempdir.name)
+        self.ff = RecordingFFmpegAudio()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tempdir.cleanup()
+
+    def test_split_outputs(self):
+        self.assertEqual(self.ff.split_outputs(self.STREAMS, "{filename}_{index}", "ep"), ["ep_0.mka", "ep_1.mka"])
+        self.assertEqual(self.ff.split_outputs(self.STREAMS, ["a", "b.MKA"]), ["a.mka", "b.MKA"])
+        self.assertEqual(self.ff.split_outputs(self.STREAMS[:1], "out"), ["out.mka"])
+
+        with self.assertRaisesRegex(ValueError, "index format specifier"):
+            self.ff.split_outputs(self.STREAMS, "out")
+        with self.assertRaisesRegex(ValueError, "Improper number"):
+            self.ff.split_outputs(self.STREAMS, ["a", "b", "c"])
+
+    def test_split(self):
+        def no_probe(*args, **kwargs):
+            raise AssertionError("split probed a file with known streams")
+
+        self.ff.get_audio_streams = no_probe
+        self.ff.split("clip.mka", "out_{index}", self.STREAMS)
+
+        self.assertEqual(self.ff.calls, [["-i", "clip.mka",
+                                          "-map", "0:0", "-c", "copy", "out_0.mka",
+                                          "-map", "0:1", "-c", "copy", "out_1.mka", "-y"]])
+
+    def test_clip_filter(self):
+        streams = [s._replace(codec=s.codec._replace(can_encode=False)) for s in self.STREAMS]
+        outs = self.ff.clip_filter("in.mkv", [(1.0, 2.0), (3.0, 4.5)], streams, ["a.mka", "b.mka"])
+
+        trim = "atrim=start={}:end={},asetpts=PTS-STARTPTS"
+        graph = (f"[0:1]{trim.format('1.000000000', '2.000000000')}[a0_0];\n"
+                 f"[0:2]{trim.format('1.000000000', '2.000000000')}[a0_1];\n"
+                 f"[0:1]{trim.format('3.000000000', '4.500000000')}[a1_0];\n"
+                 f"[0:2]{trim.format('3.000000000', '4.500000000')}[a1_1];\n"
+                 "[a0_0][a0_1][a1_0][a1_1]concat=n=2:v=0:a=2[o0][o1]")
+        [call] = self.ff.calls
+        self.assertEqual(self.ff.graphs, [graph])
+        self.assertEqual(call[:3], ["-i", "in.mkv", "-filter_complex_script"])
+        self.assertFalse(os.path.exists(call[3]))
+        # outputs go to temp files first, call[8] and call[13]
+        self.assertEqual(call[4:8] + call[9:13] + call[14:],
+                         ["-map", "[o0]", "-c:a:0", "pcm_s16le", "-map", "[o1]", "-c:a:0", "pcm_s24le", "-y"])
+        self.assertEqual(outs, ["a.mka", "b.mka"])
+        self.assertEqual(sorted(os.listdir()), ["a.mka", "b.mka"])
+
+    def test_clip_filter_cleanup(self):
+        self.ff.fail_on = "in.mkv"
+        self.ff.error = FileNotFoundError("ffmpeg")
+        with self.assertRaises(FileNotFoundError):
+            self.ff.clip_filter("in.mkv", [(1.0, 2.0), (3.0, 4.5)], self.STREAMS[1:])
+        self.assertFalse(os.path.exists(self.ff.calls[0][3]))
+        self.assertEqual(os.listdir(), [])
+
+    def test_recut_decoded(self):
+        ranges = [(float(i), i + 0.5) for i in range(1500)]
+        self.assertEqual(self.ff.recut("in.mkv", ranges, self.STREAMS[1:]), ["in.mkv_ATrim.mka"])
+
+        [call] = self.ff.calls
+        self.assertIn("-filter_complex_script", call)
+        self.assertLess(max(len(a) for a in call), 1000)
+        self.assertEqual(os.listdir(), ["in.mkv_ATrim.mka"])
+
+    def test_clip_multi(self):
+        outs = self.ff.clip_multi("in.mkv", [(1.0, 2.0), (3.0, 4.5)], self.STREAMS[:1])
+
+        clip_args = ["-c:a:0", "copy", "-map_chapters", "-1", "-avoid_negative_ts", "make_zero", "-map", "0:1"]
+        self.assertEqual(self.ff.calls, [["-i", "in.mkv",
+                                          "-ss", "1.000000000", "-to", "2.000000000", *clip_args, outs[0],
+                                          "-ss", "3.000000000", "-to", "4.500000000", *clip_args, outs[1],
+                                          "-y"]])
+
+    def test_clip_multi_batches(self):
+        ranges = [(float(i), i + 0.5) for i in range(300)]
+        outs = self.ff.clip_multi("in.mkv", ranges, self.STREAMS[:1])
+
+        self.assertGreater(len(self.ff.calls), 1)
+        for call in self.ff.calls:
+            self.assertEqual(call[:2] + call[-1:], ["-i", "in.mkv", "-y"])
+            self.assertLessEqual(sum(len(a) + 1 for a in call[2:-1]), acsuite.ffmpeg.MAX_CLIP_ARGS_LEN - len("in.mkv"))
+        starts = [b for call in self.ff.calls for a, b in zip(call, call[1:]) if a == "-ss"]
+        self.assertEqual(starts, [f"{start:.9f}" for start, _ in ranges])
+        self.assertEqual(len(outs), len(ranges))
+        self.assertEqual(sorted(os.listdir()), sorted(outs))
+
+    def test_clip_multi_cleanup(self):
+        self.ff.fail_on = "in.mkv"
+        with self.assertRaisesRegex(ValueError, "Could not clip"):
+            self.ff.clip_multi("in.mkv", [(1.0, 2.0), (3.0, 4.5)], self.STREAMS[:1])
+        self.assertEqual(os.listdir(), [])
+
+        self.ff.error = FileNotFoundError("ffmpeg")
+        with self.assertRaises(FileNotFoundError):
+            self.ff.clip_multi("in.mkv", [(1.0, 2.0), (3.0, 4.5)], self.STREAMS[:1])
+        self.assertEqual(os.listdir(), [])
+
+    def test_recut_copied(self):
+        self.assertEqual(self.ff.recut("in.mkv", [(1.0, 2.0), (3.0, 4.5)], self.STREAMS[:1]), ["in.mkv_ATrim.mka"])
+
+        clip, concat = self.ff.calls
+        self.assertEqual([a for a in clip if a == "-ss"], ["-ss", "-ss"])
+        self.assertEqual(concat[:2], ["-f", "concat"])
+        self.assertEqual(os.listdir(), ["in.mkv_ATrim.mka"])
+
+    def test_concat(self):
+        out = self.ff.concat("a b.mka", os.path.join("sub", "it's.mka"))
+
+        [call] = self.ff.calls
+        self.assertEqual(call, ["-f", "concat", "-safe", "0", "-protocol_whitelist", "pipe,file", "-i", "pipe:0",
+                                "-map", "0", "-c", "copy", "-map_chapters", "-1", "-avoid_negative_ts", "make_zero",
+                                out, "-y"])
+        # entries are absolute file: urls, quotes are closed, escaped and reopened
+        cwd = os.getcwd()
+        self.assertEqual(self.ff.inputs, [f"file 'file:{os.path.join(cwd, 'a b.mka')}'\n"
+                                          f"file 'file:{os.path.join(cwd, 'sub', 'it')}'\\''s.mka'\n"])
+
+    def test_recut_clips(self):
+        ranges = [(1.0, 2.0), (3.0, 4.5)]
+        self.assertEqual(self.ff.recut("in.mkv", ranges, self.STREAMS, parallel=False), ["in.mkv_ATrim.mka"])
+        self.assertEqual(self.ff.recut("in.mkv", ranges[:1], self.STREAMS[:1], "one"), ["one.mka"])
+        self.assertEqual(self.ff.recut("in.mkv", ranges, self.STREAMS[:1], "legacy", legacy_concat=True),
+                         ["legacy.mka"])
+
+        # every range gets its own process, with more than one range followed by a concat
+        self.assertEqual([call.count("-ss") for call in self.ff.calls], [1, 1, 0, 1, 1, 1, 0])
+        self.assertEqual([call[:2] == ["-f", "concat"] for call in self.ff.calls],
+                         [False, False, True, False, False, False, True])
+        self.assertEqual(sorted(os.listdir()), ["in.mkv_ATrim.mka", "legacy.mka", "one.mka"])
+
+    def test_recut_cleanup(self):
+        # a failed clip, an ffmpeg that can't be started, a failed concat
+        for fail_on, error in [("3.000000000", CalledProcessError(1, "ffmpeg")),
+                               ("3.000000000", FileNotFoundError("ffmpeg")),
+                               ("concat", CalledProcessError(1, "ffmpeg"))]:
+            self.ff.fail_on, self.ff.error = fail_on, error
+            for streams in (self.STREAMS, self.STREAMS[:1]):
+                with self.assertRaises((ValueError, FileNotFoundError)):
+                    self.ff.recut("in.mkv", [(1.0, 2.0), (3.0, 4.5), (5.0, 6.0)], streams)
+                self.assertEqual(os.listdir(), [])
+
+    def test_get_audio_streams(self):
+        self.ff.codecs = {"flac": self.FLAC}
+        self.ff.ffprobe_json = lambda *args: {"streams": [
+            {"index": 1, "codec_name": "aac"},
+            {"index": 2, "codec_name": "flac", "bits_per_raw_sample": "24", "bits_per_sample": 0},
+            {"index": 3, "codec_name": "pcm_s16le", "bits_per_sample": 16},
+            {"index": 4, "codec_name": "flac", "bits_per_raw_sample": "0"},
+        ]}
+
+        self.assertEqual(self.ff.get_audio_streams("in.mkv"), [
+            acsuite.AudioStream(codec=None, depth=None, stream_index=1),
+            acsuite.AudioStream(codec=self.FLAC, depth=24, stream_index=2),
+            acsuite.AudioStream(codec=None, depth=16, stream_index=3),
+            acsuite.AudioStream(codec=self.FLAC, depth=None, stream_index=4),
+        ])
+
+
 if __name__ == "__main__":
     unittest.main()